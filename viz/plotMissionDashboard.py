@@ -7,11 +7,25 @@
 #  * LICENSE file in the root directory of this source tree.
 #  */
 
+import os
+import matplotlib
+
+# "static" only exports the dashboard image, so skip loading a GUI toolkit;
+# the default "both" also opens the interactive windows
+dashboard_mode = os.environ.get("DASHBOARD_MODE", "both")
+if dashboard_mode == "static":
+    matplotlib.use("Agg")
+
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import matplotlib.pyplot as plt
 from matplotlib.collections import LineCollection
-import os
+from matplotlib.lines import Line2D
+import gc
+from contextlib import suppress
+from functools import cache, partial
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 from matplotlib.widgets import Button
@@ -23,19 +37,48 @@ from matplotlib import cm
 warnings.filterwarnings("ignore")
 
 
-# Add this near the top of the file, after imports but before any other functions
-def add_gradient_background(ax):
-    """Add a subtle gradient background to plots"""
-    nx = 100
-    ny = 100
-    gradient = np.zeros((ny, nx, 4))
-    gradient[:, :, 3] = np.linspace(0.2, 0, nx)
-    ax.imshow(
-        gradient,
-        extent=[ax.get_xlim()[0], ax.get_xlim()[1], ax.get_ylim()[0], ax.get_ylim()[1]],
-        aspect="auto",
-        zorder=0,
-    )
+def decimate(t, y, n_out=4000):
+    """Reduce a time series to about n_out points, keeping each bucket's extrema"""
+    if len(t) <= n_out:
+        return t, y
+
+    # Split every sample into near-equal buckets and keep the min and max
+    # sample of each, in time order, so spikes survive the reduction
+    n_buckets = n_out // 2
+    edges = np.linspace(0, len(t), n_buckets + 1).astype(int)
+    bucket = np.repeat(np.arange(n_buckets), np.diff(edges))
+
+    # Sorting by value within each bucket puts its min first and max last
+    order = np.lexsort((y, bucket))
+    lo = order[edges[:-1]]
+    hi = order[edges[1:] - 1]
+    idx = np.column_stack([np.minimum(lo, hi), np.maximum(lo, hi)]).ravel()
+
+    # Always keep the endpoints so the trace spans the full mission
+    idx = np.concatenate([[0], idx, [len(t) - 1]])
+    return t[idx], y[idx]
+
+
+def log10_tick_label(value, pos):
+    """Label a tick on a log10-valued axis as the value it represents"""
+    # Plain scientific notation for every tick keeps one style per axis, even
+    # when a narrow range mixes whole decades with fractional ticks
+    mantissa, exponent = f"{10**value:.2e}".split("e")
+    return f"{mantissa.rstrip('0').rstrip('.')}e{exponent}"
+
+
+def plot_components(ax, t, series, labels):
+    """Draw the components of a vector time series as a single LineCollection"""
+    line_colors = colors[: len(series)]
+    segments = [np.column_stack(decimate(t, y)) for y in series]
+    lc = LineCollection(segments, colors=line_colors, rasterized=True)
+    ax.add_collection(lc)
+    ax.autoscale_view()
+
+    # Collections have no per-line legend entries, so use proxy lines. The
+    # "best" location ignores LineCollection paths, so pin it to a corner.
+    ax.legend([Line2D([], [], color=c) for c in line_colors], labels, loc="upper right")
+    return lc
 
 
 # Use a default matplotlib style that's always available
@@ -47,6 +90,11 @@ plt.rcParams["axes.grid"] = True
 plt.rcParams["font.size"] = 12
 plt.rcParams["lines.linewidth"] = 2
 
+# Simplify dense paths before rasterizing; long simulations overdraw most pixels
+plt.rcParams["path.simplify"] = True
+plt.rcParams["path.simplify_threshold"] = 1.0
+plt.rcParams["agg.path.chunksize"] = 10000
+
 # Add these settings after the existing rcParams
 plt.style.use("dark_background")
 plt.rcParams.update(
@@ -68,6 +116,26 @@ plt.rcParams.update(
 colors = ["#4cc9f0", "#f72585", "#ffd60a", "#7209b7", "#00f5d4", "#ff9e00"]
 plt.rcParams["axes.prop_cycle"] = plt.cycler(color=colors)
 
+
+@cache
+def load_map_features():
+    """Load the ground track land, ocean and coastline features once per process"""
+    # 110m is plenty for a map ~1500 px wide. Reading the geometries here
+    # parses each Natural Earth shapefile once, however often it is drawn.
+    land_feature = cfeature.NaturalEarthFeature(
+        "physical", "land", "110m", edgecolor="none", zorder=-1
+    )
+    ocean_feature = cfeature.NaturalEarthFeature(
+        "physical", "ocean", "110m", edgecolor="none", zorder=-1
+    )
+    coastline_feature = cfeature.NaturalEarthFeature(
+        "physical", "coastline", "110m", facecolor="never"
+    )
+    for feature in (land_feature, ocean_feature, coastline_feature):
+        list(feature.geometries())
+    return land_feature, ocean_feature, coastline_feature
+
+
 # Get absolute paths
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 data_dir = os.path.join(project_root, "output")
@@ -89,15 +157,15 @@ if not os.path.exists(data_file):
         f"4. ./Earthbound"
     )
 
-# Read and validate data silently
-df = pd.read_csv(data_file)
-
-# Validate data silently
+# Columns rendered by the dashboard tabs
 expected_columns = [
     "Time (s)",
     "Position X (km)",
     "Position Y (km)",
     "Position Z (km)",
+    "Velocity X (km/s)",
+    "Velocity Y (km/s)",
+    "Velocity Z (km/s)",
     "Longitude (deg)",
     "Latitude (deg)",
     "Altitude (km)",
@@ -117,9 +185,80 @@ expected_columns = [
     "Thrust Y (N)",
     "Thrust Z (N)",
 ]
-missing_cols = set(expected_columns) - set(df.columns)
-if missing_cols:
-    raise ValueError(f"Missing expected columns: {missing_cols}")
+
+
+def load_sim_data(data_file, columns):
+    """Load simulation data through a Parquet cache kept next to the CSV"""
+    cache = data_file + ".parquet"
+
+    # Regenerate the cache whenever it is missing or unreadable (e.g. left
+    # truncated by an older run), the simulation has rewritten the CSV, or
+    # the dashboard needs columns the cache was built without
+    try:
+        cache_fresh = os.path.getmtime(cache) >= os.path.getmtime(data_file)
+        cache_fresh = cache_fresh and set(columns) <= set(pq.read_schema(cache).names)
+    except (OSError, pa.ArrowInvalid):
+        cache_fresh = False
+
+    if cache_fresh:
+        return pd.read_parquet(
+            cache, columns=columns, engine="pyarrow", dtype_backend="pyarrow"
+        )
+
+    # Every plotted column is numeric, so declare the dtypes up front instead
+    # of letting the parser infer them; usecols also raises if the simulation
+    # output is missing any expected column
+    sim_data = pd.read_csv(
+        data_file,
+        usecols=columns,
+        dtype={c: "float64" for c in columns},
+        engine="pyarrow",
+    )[columns]
+
+    # Write next to the cache and swap it in, so an interrupted run never
+    # leaves a partial cache behind. The cache only speeds up later runs, so
+    # an unwritable output directory must not stop the dashboard.
+    tmp_cache = f"{cache}.{os.getpid()}.tmp"
+    try:
+        sim_data.to_parquet(tmp_cache, engine="pyarrow", compression="zstd")
+        os.replace(tmp_cache, cache)
+    except OSError:
+        pass
+    finally:
+        with suppress(OSError):
+            os.remove(tmp_cache)
+
+    return sim_data
+
+
+# Read and validate data silently
+df = load_sim_data(data_file, expected_columns)
+
+# Extract each column once so the tabs plot from contiguous NumPy arrays
+# instead of repeating DataFrame lookups on every redraw. The arrays are
+# copies, so the DataFrame's buffers are released once it is dropped.
+arrs = {c: df[c].to_numpy(copy=True) for c in expected_columns}
+del df
+gc.collect()
+
+# Derived series shared across tabs
+t_hours = arrs["Time (s)"] / 3600.0
+omega_deg = {
+    axis: np.rad2deg(arrs[f"Angular Velocity {axis} (rad/s)"]) for axis in "XYZ"
+}
+velocity_magnitude = np.sqrt(
+    arrs["Velocity X (km/s)"] ** 2
+    + arrs["Velocity Y (km/s)"] ** 2
+    + arrs["Velocity Z (km/s)"] ** 2
+)
+
+# Ground track steps that wrap across the antimeridian
+antimeridian_jumps = np.abs(np.diff(arrs["Longitude (deg)"])) > 300
+
+# Conservation errors as powers of ten, plotted on linear axes so redraws
+# skip the log scale's transform and tick machinery
+energy_error_log10 = np.log10(np.abs(arrs["Energy Error"]))
+momentum_error_log10 = np.log10(np.abs(arrs["Angular Momentum Error"]))
 
 
 # Function to create dashboard
@@ -127,13 +266,31 @@ def create_dashboard(fig):
     # Clear the figure first
     fig.clear()
 
-    # Create global references
+    # Axes belonging to each tab, filled in once the tabs are built below
+    tabs = {}
+
+    def show_tab(name, event=None):
+        for tab_name, tab_axes in tabs.items():
+            for ax in tab_axes:
+                ax.set_visible(tab_name == name)
+        fig.canvas.draw_idle()
+
+    # Create the tab toolbar once; the buttons stay on screen for every tab
     global buttons
     buttons = []
+    handlers = {
+        name: partial(show_tab, name)
+        for name in ["Orbit", "Attitude", "Controls", "Aero"]
+    }
+    for i, (name, handler) in enumerate(handlers.items()):
+        button_ax = fig.add_axes([0.30 + i * 0.12, 0.95, 0.10, 0.03])
+        btn = Button(button_ax, name, color="#2d2d2d", hovercolor="#4d4d4d")
+        btn.label.set_color("white")
+        btn.on_clicked(handler)
+        buttons.append(btn)
 
-    def create_orbit_tab(event=None):
-        global buttons
-        fig.clear()
+    def build_orbit_tab():
+        land_feature, ocean_feature, coastline_feature = load_map_features()
 
         # Adjust gridspec to add more spacing
         gs = fig.add_gridspec(
@@ -142,9 +299,9 @@ def create_dashboard(fig):
 
         # Ground Track (full width, top)
         ax_map = fig.add_subplot(gs[0, :], projection=ccrs.PlateCarree())
-        ax_map.add_feature(cfeature.LAND, facecolor="#2d2d2d", edgecolor="#666666")
-        ax_map.add_feature(cfeature.OCEAN, facecolor="#1e1e1e")
-        ax_map.add_feature(cfeature.COASTLINE, edgecolor="#4cc9f0", linewidth=1)
+        ax_map.add_feature(land_feature, facecolor="#2d2d2d", edgecolor="#666666")
+        ax_map.add_feature(ocean_feature, facecolor="#1e1e1e")
+        ax_map.add_feature(coastline_feature, edgecolor="#4cc9f0", linewidth=1)
 
         # Add gridlines
         gl = ax_map.gridlines(
@@ -174,23 +331,22 @@ def create_dashboard(fig):
         # Set extent to cover the full latitude range
         ax_map.set_extent([-180, 180, -90, 90], crs=ccrs.PlateCarree())
 
-        # Plot ground track with time-based coloring
-        jumps = np.where(np.abs(np.diff(df["Longitude (deg)"])) > 300)[0]
-        norm = plt.Normalize(df["Time (s)"].min(), df["Time (s)"].max())
-
-        for lon_seg, lat_seg, time_seg in zip(
-            np.split(df["Longitude (deg)"], jumps + 1),
-            np.split(df["Latitude (deg)"], jumps + 1),
-            np.split(df["Time (s)"], jumps + 1),
-        ):
-            points = np.array([lon_seg, lat_seg]).T.reshape(-1, 1, 2)
-            segments = np.concatenate([points[:-1], points[1:]], axis=1)
-            lc = LineCollection(segments, cmap="plasma", norm=norm)
-            lc.set_array(time_seg[:-1])
-            ax_map.add_collection(lc)
+        # Plot ground track with time-based coloring as a single collection,
+        # blanking the segments that wrap across the antimeridian
+        lon = arrs["Longitude (deg)"]
+        lat = arrs["Latitude (deg)"]
+        t = arrs["Time (s)"]
+        norm = plt.Normalize(t.min(), t.max())
+
+        points = np.stack([lon, lat], axis=1)
+        segments = np.stack([points[:-1], points[1:]], axis=1)
+        segments[antimeridian_jumps] = np.nan
+        lc = LineCollection(segments, cmap="plasma", norm=norm, rasterized=True)
+        lc.set_array(t[:-1])
+        ax_map.add_collection(lc)
 
         # Add colorbar with adjusted positioning
-        cbar = plt.colorbar(
+        cbar = fig.colorbar(
             lc,
             ax=ax_map,
             orientation="horizontal",
@@ -204,14 +360,14 @@ def create_dashboard(fig):
 
         # Add start/end markers
         ax_map.plot(
-            df["Longitude (deg)"].iloc[0],
-            df["Latitude (deg)"].iloc[0],
+            arrs["Longitude (deg)"][0],
+            arrs["Latitude (deg)"][0],
             "go",
             label="Start",
         )
         ax_map.plot(
-            df["Longitude (deg)"].iloc[-1],
-            df["Latitude (deg)"].iloc[-1],
+            arrs["Longitude (deg)"][-1],
+            arrs["Latitude (deg)"][-1],
             "ro",
             label="End",
         )
@@ -235,21 +391,21 @@ def create_dashboard(fig):
 
         # Create colored trajectory
         points = np.array(
-            [df["Position X (km)"], df["Position Y (km)"], df["Position Z (km)"]]
+            [arrs["Position X (km)"], arrs["Position Y (km)"], arrs["Position Z (km)"]]
         ).T.reshape(-1, 1, 3)
         segments = np.concatenate([points[:-1], points[1:]], axis=1)
 
         # Create line collection for 3D
         from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
-        colors = df["Time (s)"][:-1]
+        colors = arrs["Time (s)"][:-1]
         norm = plt.Normalize(colors.min(), colors.max())
-        lc = Line3DCollection(segments, cmap="plasma", norm=norm)
+        lc = Line3DCollection(segments, cmap="plasma", norm=norm, rasterized=True)
         lc.set_array(colors)
         ax.add_collection3d(lc)
 
         # Add colorbar
-        cbar = plt.colorbar(
+        cbar = fig.colorbar(
             lc,
             ax=ax,
             orientation="horizontal",
@@ -263,9 +419,9 @@ def create_dashboard(fig):
 
         # Set equal aspect ratio and limits
         max_range = max(
-            df["Position X (km)"].abs().max(),
-            df["Position Y (km)"].abs().max(),
-            df["Position Z (km)"].abs().max(),
+            np.abs(arrs["Position X (km)"]).max(),
+            np.abs(arrs["Position Y (km)"]).max(),
+            np.abs(arrs["Position Z (km)"]).max(),
         )
         max_range = max_range * 1.1  # Add 10% margin
         ax.set_xlim([-max_range, max_range])
@@ -281,177 +437,120 @@ def create_dashboard(fig):
 
         # Orbital Altitudes (bottom right)
         ax_alt = fig.add_subplot(gs[1, 1])
-        ax_alt.plot(df["Time (s)"] / 3600, df["Altitude (km)"], "b-", label="Altitude")
+        ax_alt.plot(
+            t_hours, arrs["Altitude (km)"], "b-", label="Altitude", rasterized=True
+        )
         ax_alt.set_xlabel("Time [hours]")
         ax_alt.set_ylabel("Altitude [km]")
         ax_alt.set_title("Orbital Altitudes")
         ax_alt.grid(True)
 
-        # Clear old buttons and create new ones
-        buttons.clear()
-        for i, name in enumerate(["Orbit", "Attitude", "Controls", "Aero"]):
-            button_ax = fig.add_axes([0.30 + i * 0.12, 0.95, 0.10, 0.03])
-            btn = Button(button_ax, name, color="#2d2d2d", hovercolor="#4d4d4d")
-            btn.label.set_color("white")
-            if name == "Orbit":
-                btn.on_clicked(lambda x: create_orbit_tab())
-            elif name == "Attitude":
-                btn.on_clicked(lambda x: create_attitude_tab())
-            elif name == "Controls":
-                btn.on_clicked(lambda x: create_controls_tab())
-            else:
-                btn.on_clicked(lambda x: create_aero_tab())
-            buttons.append(btn)
-
-        plt.draw()
-
-    def create_attitude_tab(event=None):
-        global buttons
-        fig.clear()
+    def build_attitude_tab():
         gs = fig.add_gridspec(2, 2, top=0.9)
+        t = arrs["Time (s)"]
 
         # Quaternions
         ax_quat = fig.add_subplot(gs[0, :])
-        ax_quat.plot(df["Time (s)"], df["Quaternion W"], label="w (scalar)")
-        ax_quat.plot(df["Time (s)"], df["Quaternion X"], label="x")
-        ax_quat.plot(df["Time (s)"], df["Quaternion Y"], label="y")
-        ax_quat.plot(df["Time (s)"], df["Quaternion Z"], label="z")
+        plot_components(
+            ax_quat,
+            t,
+            [arrs[f"Quaternion {c}"] for c in "WXYZ"],
+            ["w (scalar)", "x", "y", "z"],
+        )
         ax_quat.set_xlabel("Time [s]")
         ax_quat.set_ylabel("Component Value")
         ax_quat.set_title("GCRS to Body Quaternion")
-        ax_quat.legend()
 
         # Angular Velocity
         ax_ang_vel = fig.add_subplot(gs[1, 0])
-        ax_ang_vel.plot(
-            df["Time (s)"], np.rad2deg(df["Angular Velocity X (rad/s)"]), label="X"
-        )
-        ax_ang_vel.plot(
-            df["Time (s)"], np.rad2deg(df["Angular Velocity Y (rad/s)"]), label="Y"
-        )
-        ax_ang_vel.plot(
-            df["Time (s)"], np.rad2deg(df["Angular Velocity Z (rad/s)"]), label="Z"
+        plot_components(
+            ax_ang_vel, t, [omega_deg[axis] for axis in "XYZ"], ["X", "Y", "Z"]
         )
         ax_ang_vel.set_xlabel("Time [s]")
         ax_ang_vel.set_ylabel("Angular Rate [deg/s]")
         ax_ang_vel.set_title("Body Angular Velocity")
-        ax_ang_vel.legend()
 
         # RSW Error
         ax_rsw = fig.add_subplot(gs[1, 1])
-        ax_rsw.plot(df["Time (s)"], df["Energy Error"], "r-", label="Energy Error")
         ax_rsw.plot(
-            df["Time (s)"],
-            df["Angular Momentum Error"],
+            *decimate(t, arrs["Energy Error"]),
+            "r-",
+            label="Energy Error",
+            rasterized=True,
+        )
+        ax_rsw.plot(
+            *decimate(t, arrs["Angular Momentum Error"]),
             "b-",
             label="Angular Momentum Error",
+            rasterized=True,
         )
         ax_rsw.set_xlabel("Time [s]")
         ax_rsw.set_ylabel("Error")
         ax_rsw.set_title("Energy and Angular Momentum Conservation Error")
         ax_rsw.legend()
 
-        # Clear old buttons and create new ones
-        buttons.clear()
-        for i, name in enumerate(["Orbit", "Attitude", "Controls", "Aero"]):
-            button_ax = fig.add_axes([0.30 + i * 0.12, 0.95, 0.10, 0.03])
-            btn = Button(button_ax, name, color="#2d2d2d", hovercolor="#4d4d4d")
-            btn.label.set_color("white")
-            if name == "Orbit":
-                btn.on_clicked(lambda x: create_orbit_tab())
-            elif name == "Attitude":
-                btn.on_clicked(lambda x: create_attitude_tab())
-            elif name == "Controls":
-                btn.on_clicked(lambda x: create_controls_tab())
-            else:
-                btn.on_clicked(lambda x: create_aero_tab())
-            buttons.append(btn)
-
-        plt.draw()
-
-    def create_controls_tab(event=None):
-        global buttons
-        fig.clear()
+    def build_controls_tab():
         gs = fig.add_gridspec(2, 2, top=0.9, hspace=0.3, wspace=0.3)
 
         # Control Torques
         ax_torque = fig.add_subplot(gs[0, 0])
-        ax_torque.plot(df["Time (s)"] / 3600, df["Control Torque X (N⋅m)"], label="X")
-        ax_torque.plot(df["Time (s)"] / 3600, df["Control Torque Y (N⋅m)"], label="Y")
-        ax_torque.plot(df["Time (s)"] / 3600, df["Control Torque Z (N⋅m)"], label="Z")
+        plot_components(
+            ax_torque,
+            t_hours,
+            [arrs[f"Control Torque {axis} (N⋅m)"] for axis in "XYZ"],
+            ["X", "Y", "Z"],
+        )
         ax_torque.set_xlabel("Time [hours]")
         ax_torque.set_ylabel("Torque [N⋅m]")
         ax_torque.set_title("Control Torques")
-        ax_torque.legend()
 
         # Thrust Forces
         ax_thrust = fig.add_subplot(gs[0, 1])
-        ax_thrust.plot(df["Time (s)"] / 3600, df["Thrust X (N)"], label="X")
-        ax_thrust.plot(df["Time (s)"] / 3600, df["Thrust Y (N)"], label="Y")
-        ax_thrust.plot(df["Time (s)"] / 3600, df["Thrust Z (N)"], label="Z")
+        plot_components(
+            ax_thrust,
+            t_hours,
+            [arrs[f"Thrust {axis} (N)"] for axis in "XYZ"],
+            ["X", "Y", "Z"],
+        )
         ax_thrust.set_xlabel("Time [hours]")
         ax_thrust.set_ylabel("Thrust [N]")
         ax_thrust.set_title("Thrust Forces")
-        ax_thrust.legend()
 
         # Energy Error
         ax_energy = fig.add_subplot(gs[1, 0])
-        ax_energy.plot(df["Time (s)"] / 3600, df["Energy Error"])
+        ax_energy.plot(*decimate(t_hours, energy_error_log10), rasterized=True)
         ax_energy.set_xlabel("Time [hours]")
         ax_energy.set_ylabel("Relative Error")
         ax_energy.set_title("Energy Conservation Error")
-        ax_energy.set_yscale("log")
+        ax_energy.yaxis.set_major_locator(plt.MaxNLocator(integer=True))
+        ax_energy.yaxis.set_major_formatter(plt.FuncFormatter(log10_tick_label))
 
         # Angular Momentum Error
         ax_momentum = fig.add_subplot(gs[1, 1])
-        ax_momentum.plot(df["Time (s)"] / 3600, df["Angular Momentum Error"])
+        ax_momentum.plot(*decimate(t_hours, momentum_error_log10), rasterized=True)
         ax_momentum.set_xlabel("Time [hours]")
         ax_momentum.set_ylabel("Relative Error")
         ax_momentum.set_title("Angular Momentum Conservation Error")
-        ax_momentum.set_yscale("log")
-
-        # Add buttons
-        buttons.clear()
-        for i, name in enumerate(["Orbit", "Attitude", "Controls", "Aero"]):
-            button_ax = fig.add_axes([0.30 + i * 0.12, 0.95, 0.10, 0.03])
-            btn = Button(button_ax, name, color="#2d2d2d", hovercolor="#4d4d4d")
-            btn.label.set_color("white")
-            if name == "Orbit":
-                btn.on_clicked(lambda x: create_orbit_tab())
-            elif name == "Attitude":
-                btn.on_clicked(lambda x: create_attitude_tab())
-            elif name == "Controls":
-                btn.on_clicked(lambda x: create_controls_tab())
-            else:
-                btn.on_clicked(lambda x: create_aero_tab())
-            buttons.append(btn)
-
-        plt.draw()
-
-    def create_aero_tab(event=None):
-        global buttons
-        fig.clear()
+        ax_momentum.yaxis.set_major_locator(plt.MaxNLocator(integer=True))
+        ax_momentum.yaxis.set_major_formatter(plt.FuncFormatter(log10_tick_label))
+
+    def build_aero_tab():
         gs = fig.add_gridspec(1, 1, top=0.9)
 
         # Altitude vs Velocity plot
         ax = fig.add_subplot(gs[0, 0])
-        velocity_magnitude = np.sqrt(
-            df["Velocity X (km/s)"] ** 2
-            + df["Velocity Y (km/s)"] ** 2
-            + df["Velocity Z (km/s)"] ** 2
-        )
 
         # Create scatter plot with time-based coloring
         scatter = ax.scatter(
             velocity_magnitude,
-            df["Altitude (km)"],
-            c=df["Time (s)"],
+            arrs["Altitude (km)"],
+            c=arrs["Time (s)"],
             cmap="plasma",
             alpha=0.6,
         )
 
         # Add colorbar
-        cbar = plt.colorbar(scatter)
+        cbar = fig.colorbar(scatter, ax=ax)
         cbar.set_label("Mission Elapsed Time [hours]")
         cbar.ax.yaxis.set_major_formatter(
             plt.FuncFormatter(lambda x, p: f"{x / 3600:.1f}")
@@ -462,61 +561,52 @@ def create_dashboard(fig):
         ax.set_title("Altitude vs Velocity")
         ax.grid(True)
 
-        # Clear old buttons and create new ones
-        buttons.clear()
-        for i, name in enumerate(["Orbit", "Attitude", "Controls", "Aero"]):
-            button_ax = fig.add_axes([0.30 + i * 0.12, 0.95, 0.10, 0.03])
-            btn = Button(button_ax, name, color="#2d2d2d", hovercolor="#4d4d4d")
-            btn.label.set_color("white")
-            if name == "Orbit":
-                btn.on_clicked(lambda x: create_orbit_tab())
-            elif name == "Attitude":
-                btn.on_clicked(lambda x: create_attitude_tab())
-            elif name == "Controls":
-                btn.on_clicked(lambda x: create_controls_tab())
-            else:
-                btn.on_clicked(lambda x: create_aero_tab())
-            buttons.append(btn)
-
-        plt.draw()
+    # Build every tab once up front; switching tabs only toggles visibility
+    tab_builders = [
+        ("Orbit", build_orbit_tab),
+        ("Attitude", build_attitude_tab),
+        ("Controls", build_controls_tab),
+        ("Aero", build_aero_tab),
+    ]
+
+    # Static mode only saves the initial Orbit tab, so skip building the rest
+    if dashboard_mode == "static":
+        tab_builders = tab_builders[:1]
+
+    for name, build_tab in tab_builders:
+        existing_axes = set(fig.axes)
+        build_tab()
+        tabs[name] = [ax for ax in fig.axes if ax not in existing_axes]
 
     # Show initial tab
-    create_orbit_tab()
+    show_tab("Orbit")
 
     return fig
 
 
-# Create and save static dashboard
-static_fig = plt.figure(figsize=(15, 10))
-create_dashboard(static_fig)
-plt.savefig(
+# Create the dashboard once; the static image is saved from the same figure
+# that is then shown interactively unless running in static mode
+dashboard_fig = plt.figure(figsize=(15, 10))
+create_dashboard(dashboard_fig)
+dashboard_fig.savefig(
     os.path.join(docs_dir, "mission_dashboard.png"), dpi=300, bbox_inches="tight"
 )
-plt.close()
 
-# Create interactive dashboard
-interactive_fig = plt.figure(figsize=(15, 10))
-create_dashboard(interactive_fig)
-
-# Create separate interactive 3D plot window
-fig3d = plt.figure(figsize=(8, 8))
-ax3d = fig3d.add_subplot(111, projection="3d")
-ax3d.plot(df["Position X (km)"], df["Position Y (km)"], df["Position Z (km)"])
-ax3d.set_xlabel("X [km]")
-ax3d.set_ylabel("Y [km]")
-ax3d.set_zlabel("Z [km]")
-ax3d.set_title("Interactive Orbital Trajectory")
-ax3d.grid(True)
-
-
-# Make 3D plot interactive
-def on_move(event):
-    if event.inaxes == ax3d:
-        ax3d.view_init(elev=ax3d.elev, azim=ax3d.azim)
-        fig3d.canvas.draw_idle()
-
-
-fig3d.canvas.mpl_connect("motion_notify_event", on_move)
-
-# Show both interactive plots
-plt.show()
+if dashboard_mode != "static":
+    # Create separate interactive 3D plot window
+    fig3d = plt.figure(figsize=(8, 8))
+    ax3d = fig3d.add_subplot(111, projection="3d")
+    ax3d.plot(
+        arrs["Position X (km)"],
+        arrs["Position Y (km)"],
+        arrs["Position Z (km)"],
+        rasterized=True,
+    )
+    ax3d.set_xlabel("X [km]")
+    ax3d.set_ylabel("Y [km]")
+    ax3d.set_zlabel("Z [km]")
+    ax3d.set_title("Interactive Orbital Trajectory")
+    ax3d.grid(True)
+
+    # Show both interactive plots
+    plt.show()
@@ -0,0 +1,47 @@
+import ast
+import pathlib
+
+import numpy as np
+
+DASHBOARD = pathlib.Path(__file__).resolve().parents[1] / "plotMissionDashboard.py"
+
+
+def load_decimate():
+    # The dashboard script renders on import, so pull out just the helper
+    tree = ast.parse(DASHBOARD.read_text(encoding="utf-8"))
+    fn = next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.FunctionDef) and node.name == "decimate"
+    )
+    namespace = {"np": np}
+    exec(
+        compile(ast.Module(body=[fn], type_ignores=[]), str(DASHBOARD), "exec"),
+        namespace,
+    )
+    return namespace["decimate"]
+
+
+def test_decimate_keeps_late_spike():
+    decimate = load_decimate()
+    for n in (5999, 7999, 101999):
+        t = np.arange(n, dtype=float)
+        y = np.zeros(n)
+        y[n - 200] = 5.0
+
+        td, yd = decimate(t, y, n_out=4000)
+
+        assert yd.max() == 5.0
+        assert len(td) <= 4002
+        assert td[0] == t[0] and td[-1] == t[-1]
+        assert np.all(np.diff(td) >= 0)
+
+
+def test_decimate_short_series_unchanged():
+    decimate = load_decimate()
+    t = np.arange(10, dtype=float)
+    y = np.sin(t)
+
+    td, yd = decimate(t, y, n_out=4000)
+
+    assert td is t and yd is y